@@ -0,0 +1,33 @@
+"""Prime the on-disk numba cache for the compiled kernels.
+
+``numba.pycc`` ahead-of-time compilation was removed from numba, so the
+supported way to avoid first-call JIT cost is to compile every kernel once
+with ``cache=True`` and let later runs load the machine code straight from
+the cache directory. Run ``python -m seam_carving._warmup`` after
+installation (or in CI setup) to pay the compilation cost up front.
+"""
+
+import numpy as np
+
+from seam_carving import carve
+
+
+def warm_up() -> None:
+    """Compile and cache every numba kernel on tiny inputs."""
+    gray = np.arange(64, dtype=np.uint8).reshape(8, 8)
+    rgb = np.arange(192, dtype=np.uint8).reshape(8, 8, 3)
+    mask = np.zeros((8, 8), dtype=bool)
+    mask[3:5, 3:5] = True
+    for energy_mode in ("backward", "forward"):
+        # reduction and expansion cover the DP, Sobel, compaction and
+        # insertion kernels for both grayscale and rgb inputs
+        carve.resize(gray, (6, 6), energy_mode=energy_mode)
+        carve.resize(rgb, (10, 10), energy_mode=energy_mode)
+    carve.resize(rgb, (6, 8), keep_mask=mask)
+    carve.resize(rgb, drop_mask=mask)
+    # static (recompute_energy=False) path and its k-best kernels
+    carve.resize_advanced(gray, (6, 8), recompute_energy=False)
+
+
+if __name__ == "__main__":
+    warm_up()
@@ -4,7 +4,6 @@ from typing import Optional, Tuple, List, Union
 
 import numba as nb
 import numpy as np
-from scipy.ndimage import sobel
 
 DROP_MASK_ENERGY = 1e5
 KEEP_MASK_ENERGY = 1e3
@@ -25,55 +24,277 @@ def _list_enum(enum_class) -> Tuple:
 
 
 def _rgb2gray(rgb: np.ndarray) -> np.ndarray:
-    """Convert an RGB image to a grayscale image"""
+    """Convert an RGB image to a grayscale image
+
+    Channels are combined with elementwise ufuncs rather than ``rgb @ coeffs``:
+    matmul picks its reduction strategy from the array shape, so the same pixel
+    could gray to a different last bit before and after carving.
+    """
     coeffs = np.array([0.2125, 0.7154, 0.0721], dtype=np.float32)
-    return (rgb @ coeffs).astype(rgb.dtype)
+    gray = coeffs[0] * rgb[..., 0] + coeffs[1] * rgb[..., 1]
+    gray += coeffs[2] * rgb[..., 2]
+    return gray
+
 
+@nb.njit(parallel=True, cache=True)
+def _remove_seam_2d(src: np.ndarray, seam: np.ndarray, out: np.ndarray) -> None:
+    h = src.shape[0]
+    for r in nb.prange(h):
+        s = seam[r]
+        out[r, :s] = src[r, :s]
+        out[r, s:] = src[r, s + 1 :]
 
-def _get_seam_mask(src: np.ndarray, seam: np.ndarray) -> np.ndarray:
-    """Convert a list of seam column indices to a mask"""
-    return np.eye(src.shape[1], dtype=bool)[seam]
 
+@nb.njit(parallel=True, cache=True)
+def _remove_seam_3d(src: np.ndarray, seam: np.ndarray, out: np.ndarray) -> None:
+    h = src.shape[0]
+    for r in nb.prange(h):
+        s = seam[r]
+        out[r, :s] = src[r, :s]
+        out[r, s:] = src[r, s + 1 :]
 
-def _remove_seam_mask(src: np.ndarray, seam_mask: np.ndarray) -> np.ndarray:
-    """Remove a seam from the source image according to the given seam_mask"""
+
+def _remove_seam(src: np.ndarray, seam: np.ndarray) -> np.ndarray:
+    """Remove a seam given by per-row column indices from the source image"""
     if src.ndim == 3:
         h, w, c = src.shape
-        seam_mask = np.broadcast_to(seam_mask[:, :, None], src.shape)
-        dst = src[~seam_mask].reshape((h, w - 1, c))
+        out = np.empty((h, w - 1, c), dtype=src.dtype)
+        _remove_seam_3d(src, seam, out)
     else:
         h, w = src.shape
-        dst = src[~seam_mask].reshape((h, w - 1))
-    return dst
+        out = np.empty((h, w - 1), dtype=src.dtype)
+        _remove_seam_2d(src, seam, out)
+    return out
+
+
+@nb.njit(
+    nb.void(nb.float32[:, :], nb.float32[:, :], nb.int64, nb.int64),
+    parallel=True,
+    cache=True,
+)
+def _sobel_abs_sum(gray: np.ndarray, out: np.ndarray, lo: int, hi: int) -> None:
+    """Compute |Gx| + |Gy| of the Sobel operator in a single fused pass
+
+    Only columns in ``[lo, hi)`` are written into ``out``, so an existing
+    energy buffer can be refreshed in-place around a removed seam. No
+    fastmath here: a pixel's energy must come out bit-identical whether it
+    was computed in a full pass or a band refresh, and fastmath would let
+    the contraction vary with the loop width.
+    """
+    h, w = gray.shape
+    band_lo = lo - 1 if lo > 0 else 0
+    band_hi = hi + 1 if hi < w else w
+    n = band_hi - band_lo
+    for r in nb.prange(h):
+        up = r - 1 if r > 0 else 0
+        down = r + 1 if r < h - 1 else h - 1
+        # Per-row partial sums: the vertical [1, 2, 1] smoothing and the
+        # vertical difference, shared between the Gx and Gy stencils.
+        col_sum = np.empty(n, dtype=np.float32)
+        row_diff = np.empty(n, dtype=np.float32)
+        for t in range(n):
+            j = band_lo + t
+            col_sum[t] = gray[up, j] + 2 * gray[r, j] + gray[down, j]
+            row_diff[t] = gray[down, j] - gray[up, j]
+        for j in range(lo, hi):
+            t = j - band_lo
+            left = t - 1 if j > 0 else t
+            right = t + 1 if j < w - 1 else t
+            grad_x = col_sum[right] - col_sum[left]
+            grad_y = row_diff[left] + 2 * row_diff[t] + row_diff[right]
+            out[r, j] = abs(grad_x) + abs(grad_y)
+
+
+@nb.njit(
+    nb.void(nb.uint8[:, :], nb.int16[:, :], nb.int64, nb.int64),
+    parallel=True,
+    cache=True,
+)
+def _sobel_abs_sum_u8(gray: np.ndarray, out: np.ndarray, lo: int, hi: int) -> None:
+    """Integer twin of ``_sobel_abs_sum`` for 8-bit sources
+
+    |Gx| + |Gy| of a uint8 image is at most 4080, so the energy fits int16
+    with int32 intermediates.
+    """
+    h, w = gray.shape
+    band_lo = lo - 1 if lo > 0 else 0
+    band_hi = hi + 1 if hi < w else w
+    n = band_hi - band_lo
+    for r in nb.prange(h):
+        up = r - 1 if r > 0 else 0
+        down = r + 1 if r < h - 1 else h - 1
+        col_sum = np.empty(n, dtype=np.int32)
+        row_diff = np.empty(n, dtype=np.int32)
+        for t in range(n):
+            j = band_lo + t
+            col_sum[t] = (
+                np.int32(gray[up, j]) + 2 * np.int32(gray[r, j]) + np.int32(gray[down, j])
+            )
+            row_diff[t] = np.int32(gray[down, j]) - np.int32(gray[up, j])
+        for j in range(lo, hi):
+            t = j - band_lo
+            left = t - 1 if j > 0 else t
+            right = t + 1 if j < w - 1 else t
+            grad_x = col_sum[right] - col_sum[left]
+            grad_y = row_diff[left] + 2 * row_diff[t] + row_diff[right]
+            out[r, j] = np.int16(abs(grad_x) + abs(grad_y))
+
+
+@nb.njit(
+    [
+        nb.void(nb.float32[:, :], nb.int32[:], nb.int64),
+        nb.void(nb.int32[:, :], nb.int32[:], nb.int64),
+        nb.void(nb.int16[:, :], nb.int32[:], nb.int64),
+        nb.void(nb.uint8[:, :], nb.int32[:], nb.int64),
+    ],
+    parallel=True,
+    cache=True,
+)
+def _compact_rows(buf: np.ndarray, seam: np.ndarray, cur_w: int) -> None:
+    """Drop one column per row in-place by shifting the row tail left"""
+    h = buf.shape[0]
+    for r in nb.prange(h):
+        for j in range(seam[r], cur_w - 1):
+            buf[r, j] = buf[r, j + 1]
+
+
+@nb.njit(
+    nb.void(nb.int32[:, :], nb.int32[:], nb.int64, nb.boolean[:, :]),
+    parallel=True,
+    cache=True,
+)
+def _mark_seam_and_compact(
+    orig_col: np.ndarray, seam: np.ndarray, cur_w: int, seams: np.ndarray
+) -> None:
+    """Mark the seam in original coordinates and compact the column map
+
+    ``orig_col[r]`` holds the original column index of every surviving pixel
+    in row ``r``; marking and shifting in one pass avoids a separate gather
+    and scatter over the map per seam.
+    """
+    h = orig_col.shape[0]
+    for r in nb.prange(h):
+        s = seam[r]
+        seams[r, orig_col[r, s]] = True
+        for j in range(s, cur_w - 1):
+            orig_col[r, j] = orig_col[r, j + 1]
 
 
 def _get_energy(gray: np.ndarray) -> np.ndarray:
     """Get backward energy map from the source image"""
     assert gray.ndim == 2
 
-    gray = gray.astype(np.float32)
-    grad_x = sobel(gray, axis=1)
-    grad_y = sobel(gray, axis=0)
-    energy = np.abs(grad_x) + np.abs(grad_y)
+    gray = np.ascontiguousarray(gray, dtype=np.float32)
+    energy = np.empty_like(gray)
+    _sobel_abs_sum(gray, energy, 0, gray.shape[1])
     return energy
 
 
-@nb.njit(nb.int32[:](nb.float32[:, :]), cache=True)
-def _get_backward_seam(energy: np.ndarray) -> np.ndarray:
-    """Compute the minimum vertical seam from the backward energy map"""
+# Finite sentinel for the padded DP columns: large enough to never win a
+# comparison, but not np.inf, which fastmath is allowed to assume away.
+_DP_SENTINEL = np.float32(3.0e38)
+
+
+@nb.njit(
+    nb.int32[:](nb.float32[:, :], nb.int32[:, :], nb.float32[:], nb.float32[:]),
+    fastmath=True,
+    boundscheck=False,
+    cache=True,
+)
+def _get_backward_seam(
+    energy: np.ndarray, parent: np.ndarray, cost: np.ndarray, new_cost: np.ndarray
+) -> np.ndarray:
+    """Compute the minimum vertical seam from the backward energy map
+
+    ``parent`` and the two cost rows are caller-owned scratch buffers so they
+    can be reused across seam iterations.
+    """
     h, w = energy.shape
-    inf = np.array([np.inf], dtype=np.float32)
-    cost = np.concatenate((inf, energy[0], inf))
-    parent = np.empty((h, w), dtype=np.int32)
-    base_idx = np.arange(-1, w - 1, dtype=np.int32)
+    cost[0] = _DP_SENTINEL
+    cost[w + 1] = _DP_SENTINEL
+    new_cost[0] = _DP_SENTINEL
+    new_cost[w + 1] = _DP_SENTINEL
+    for j in range(w):
+        cost[j + 1] = energy[0, j]
 
     for r in range(1, h):
-        choices = np.vstack((cost[:-2], cost[1:-1], cost[2:]))
-        min_idx = np.argmin(choices, axis=0) + base_idx
-        parent[r] = min_idx
-        cost[1:-1] = cost[1:-1][min_idx] + energy[r]
+        for j in range(w):
+            left = cost[j]
+            mid = cost[j + 1]
+            right = cost[j + 2]
+            if left <= mid and left <= right:
+                p = j - 1
+                m = left
+            elif mid <= right:
+                p = j
+                m = mid
+            else:
+                p = j + 1
+                m = right
+            parent[r, j] = p
+            new_cost[j + 1] = m + energy[r, j]
+        cost, new_cost = new_cost, cost
+
+    c = 0
+    for j in range(1, w):
+        if cost[j + 1] < cost[c + 1]:
+            c = j
+    seam = np.empty(h, dtype=np.int32)
+    for r in range(h - 1, -1, -1):
+        seam[r] = c
+        c = parent[r, c]
+
+    return seam
 
-    c = np.argmin(cost[1:-1])
+
+# Integer counterpart of _DP_SENTINEL; halved so adding an energy term to a
+# padded column can never overflow int32.
+_DP_SENTINEL_I32 = np.int32(np.iinfo(np.int32).max // 2)
+
+
+@nb.njit(
+    nb.int32[:](nb.int16[:, :], nb.int32[:, :], nb.int32[:], nb.int32[:]),
+    boundscheck=False,
+    cache=True,
+)
+def _get_backward_seam_i16(
+    energy: np.ndarray, parent: np.ndarray, cost: np.ndarray, new_cost: np.ndarray
+) -> np.ndarray:
+    """Integer twin of ``_get_backward_seam`` for int16 energy maps
+
+    Cumulative costs are carried in int32, which halves the memory traffic of
+    the hot cost/energy reads for 8-bit sources.
+    """
+    h, w = energy.shape
+    cost[0] = _DP_SENTINEL_I32
+    cost[w + 1] = _DP_SENTINEL_I32
+    new_cost[0] = _DP_SENTINEL_I32
+    new_cost[w + 1] = _DP_SENTINEL_I32
+    for j in range(w):
+        cost[j + 1] = energy[0, j]
+
+    for r in range(1, h):
+        for j in range(w):
+            left = cost[j]
+            mid = cost[j + 1]
+            right = cost[j + 2]
+            if left <= mid and left <= right:
+                p = j - 1
+                m = left
+            elif mid <= right:
+                p = j
+                m = mid
+            else:
+                p = j + 1
+                m = right
+            parent[r, j] = p
+            new_cost[j + 1] = m + energy[r, j]
+        cost, new_cost = new_cost, cost
+
+    c = 0
+    for j in range(1, w):
+        if cost[j + 1] < cost[c + 1]:
+            c = j
     seam = np.empty(h, dtype=np.int32)
     for r in range(h - 1, -1, -1):
         seam[r] = c
@@ -88,83 +309,149 @@ def _get_backward_seams(
     """Compute the minimum N vertical seams using backward energy"""
     h, w = gray.shape
     seams = np.zeros((h, w), dtype=bool)
-    rows = np.arange(h, dtype=np.int32)
-    idx_map = np.broadcast_to(np.arange(w, dtype=np.int32), (h, w))
+    orig_col = np.empty((h, w), dtype=np.int32)
+    orig_col[:] = np.arange(w, dtype=np.int32)
+    # Local copies: the buffers below are compacted in-place as seams are
+    # removed, and must not alias the caller's arrays.
+    gray = gray.astype(np.float32)
+    if aux_energy is not None:
+        aux_energy = aux_energy.astype(np.float32)
     energy = _get_energy(gray)
     if aux_energy is not None:
         energy += aux_energy
+    parent = np.empty((h, w), dtype=np.int32)
+    cost = np.empty(w + 2, dtype=np.float32)
+    new_cost = np.empty(w + 2, dtype=np.float32)
+    cur_w = w
     for _ in range(num_seams):
-        seam = _get_backward_seam(energy)
-        seams[rows, idx_map[rows, seam]] = True
-
-        seam_mask = _get_seam_mask(gray, seam)
-        gray = _remove_seam_mask(gray, seam_mask)
-        idx_map = _remove_seam_mask(idx_map, seam_mask)
+        seam = _get_backward_seam(
+            energy[:, :cur_w],
+            parent[:, :cur_w],
+            cost[: cur_w + 2],
+            new_cost[: cur_w + 2],
+        )
+        _mark_seam_and_compact(orig_col, seam, cur_w, seams)
+        _compact_rows(gray, seam, cur_w)
+        _compact_rows(energy, seam, cur_w)
         if aux_energy is not None:
-            aux_energy = _remove_seam_mask(aux_energy, seam_mask)
+            _compact_rows(aux_energy, seam, cur_w)
+        cur_w -= 1
 
         # Only need to re-compute the energy in the bounding box of the seam
-        _, cur_w = energy.shape
-        lo = max(0, np.min(seam) - 1)
-        hi = min(cur_w, np.max(seam) + 1)
-        pad_lo = 1 if lo > 0 else 0
-        pad_hi = 1 if hi < cur_w - 1 else 0
-        mid_block = gray[:, lo - pad_lo : hi + pad_hi]
-        _, mid_w = mid_block.shape
-        mid_energy = _get_energy(mid_block)[:, pad_lo : mid_w - pad_hi]
+        lo = max(0, int(np.min(seam)) - 1)
+        hi = min(cur_w, int(np.max(seam)) + 1)
+        _sobel_abs_sum(gray[:, :cur_w], energy[:, :cur_w], lo, hi)
         if aux_energy is not None:
-            mid_energy += aux_energy[:, lo:hi]
-        energy = np.hstack((energy[:, :lo], mid_energy, energy[:, hi + 1 :]))
+            energy[:, lo:hi] += aux_energy[:, lo:hi]
+
+    return seams
+
+
+def _get_backward_seams_u8(gray: np.ndarray, num_seams: int) -> np.ndarray:
+    """Backward-energy seams for uint8 sources via the integer DP
+
+    Only valid without an aux energy: mask energies do not fit int16. The
+    seams match the float path, whose costs are int-valued anyway.
+    """
+    h, w = gray.shape
+    seams = np.zeros((h, w), dtype=bool)
+    orig_col = np.empty((h, w), dtype=np.int32)
+    orig_col[:] = np.arange(w, dtype=np.int32)
+    gray = gray.copy()
+    energy = np.empty((h, w), dtype=np.int16)
+    _sobel_abs_sum_u8(gray, energy, 0, w)
+    parent = np.empty((h, w), dtype=np.int32)
+    cost = np.empty(w + 2, dtype=np.int32)
+    new_cost = np.empty(w + 2, dtype=np.int32)
+    cur_w = w
+    for _ in range(num_seams):
+        seam = _get_backward_seam_i16(
+            energy[:, :cur_w],
+            parent[:, :cur_w],
+            cost[: cur_w + 2],
+            new_cost[: cur_w + 2],
+        )
+        _mark_seam_and_compact(orig_col, seam, cur_w, seams)
+        _compact_rows(gray, seam, cur_w)
+        _compact_rows(energy, seam, cur_w)
+        cur_w -= 1
+
+        # Only need to re-compute the energy in the bounding box of the seam
+        lo = max(0, int(np.min(seam)) - 1)
+        hi = min(cur_w, int(np.max(seam)) + 1)
+        _sobel_abs_sum_u8(gray[:, :cur_w], energy[:, :cur_w], lo, hi)
 
     return seams
 
 
 @nb.njit(
     [
-        nb.int32[:](nb.float32[:, :], nb.none),
-        nb.int32[:](nb.float32[:, :], nb.float32[:, :]),
+        nb.int32[:](
+            nb.float32[:, :], nb.none, nb.int32[:, :], nb.float32[:], nb.float32[:]
+        ),
+        nb.int32[:](
+            nb.float32[:, :],
+            nb.float32[:, :],
+            nb.int32[:, :],
+            nb.float32[:],
+            nb.float32[:],
+        ),
     ],
+    fastmath=True,
+    boundscheck=False,
     cache=True,
 )
-def _get_forward_seam(gray: np.ndarray, aux_energy: Optional[np.ndarray]) -> np.ndarray:
-    """Compute the minimum vertical seam using forward energy"""
-    h, w = gray.shape
-
-    gray = np.hstack((gray[:, :1], gray, gray[:, -1:]))
+def _get_forward_seam(
+    gray: np.ndarray,
+    aux_energy: Optional[np.ndarray],
+    parent: np.ndarray,
+    dp: np.ndarray,
+    new_dp: np.ndarray,
+) -> np.ndarray:
+    """Compute the minimum vertical seam using forward energy
 
-    inf = np.array([np.inf], dtype=np.float32)
-    dp = np.concatenate((inf, np.abs(gray[0, 2:] - gray[0, :-2]), inf))
+    ``gray`` is expected with its first and last columns replicated, i.e.
+    padded to width w + 2. ``parent`` and the two dp rows are caller-owned
+    scratch buffers so they can be reused across seam iterations.
+    """
+    h = gray.shape[0]
+    w = gray.shape[1] - 2
 
-    parent = np.empty((h, w), dtype=np.int32)
-    base_idx = np.arange(-1, w - 1, dtype=np.int32)
+    dp[0] = _DP_SENTINEL
+    dp[w + 1] = _DP_SENTINEL
+    new_dp[0] = _DP_SENTINEL
+    new_dp[w + 1] = _DP_SENTINEL
+    for j in range(w):
+        dp[j + 1] = abs(gray[0, j + 2] - gray[0, j])
 
-    inf = np.array([np.inf], dtype=np.float32)
     for r in range(1, h):
-        curr_shl = gray[r, 2:]
-        curr_shr = gray[r, :-2]
-        cost_mid = np.abs(curr_shl - curr_shr)
-        if aux_energy is not None:
-            cost_mid += aux_energy[r]
-
-        prev_mid = gray[r - 1, 1:-1]
-        cost_left = cost_mid + np.abs(prev_mid - curr_shr)
-        cost_right = cost_mid + np.abs(prev_mid - curr_shl)
-
-        dp_mid = dp[1:-1]
-        dp_left = dp[:-2]
-        dp_right = dp[2:]
-
-        choices = np.vstack(
-            (cost_left + dp_left, cost_mid + dp_mid, cost_right + dp_right)
-        )
-        min_idx = np.argmin(choices, axis=0)
-        parent[r] = min_idx + base_idx
-        # numba does not support specifying axis in np.min, below loop is equivalent to:
-        # `dp_mid[:] = np.min(choices, axis=0)` or `dp_mid[:] = choices[min_idx, np.arange(w)]`
-        for j, i in enumerate(min_idx):
-            dp_mid[j] = choices[i, j]
-
-    c = np.argmin(dp[1:-1])
+        for j in range(w):
+            curr_shl = gray[r, j + 2]
+            curr_shr = gray[r, j]
+            prev_mid = gray[r - 1, j + 1]
+            cost_mid = abs(curr_shl - curr_shr)
+            if aux_energy is not None:
+                cost_mid += aux_energy[r, j]
+            cand_left = cost_mid + abs(prev_mid - curr_shr) + dp[j]
+            cand_right = cost_mid + abs(prev_mid - curr_shl) + dp[j + 2]
+            cand_mid = cost_mid + dp[j + 1]
+            if cand_left <= cand_mid and cand_left <= cand_right:
+                p = j - 1
+                m = cand_left
+            elif cand_mid <= cand_right:
+                p = j
+                m = cand_mid
+            else:
+                p = j + 1
+                m = cand_right
+            parent[r, j] = p
+            new_dp[j + 1] = m
+        dp, new_dp = new_dp, dp
+
+    c = 0
+    for j in range(1, w):
+        if dp[j + 1] < dp[c + 1]:
+            c = j
     seam = np.empty(h, dtype=np.int32)
     for r in range(h - 1, -1, -1):
         seam[r] = c
@@ -179,16 +466,38 @@ def _get_forward_seams(
     """Compute minimum N vertical seams using forward energy"""
     h, w = gray.shape
     seams = np.zeros((h, w), dtype=bool)
-    rows = np.arange(h, dtype=np.int32)
-    idx_map = np.broadcast_to(np.arange(w, dtype=np.int32), (h, w))
+    orig_col = np.empty((h, w), dtype=np.int32)
+    orig_col[:] = np.arange(w, dtype=np.int32)
+    # Local copies: the buffers below are compacted in-place as seams are
+    # removed, and must not alias the caller's arrays. The grayscale buffer
+    # keeps its first and last columns replicated so the DP kernel can read
+    # it without re-padding every call.
+    gray_padded = np.empty((h, w + 2), dtype=np.float32)
+    gray_padded[:, 1 : w + 1] = gray
+    gray_padded[:, 0] = gray_padded[:, 1]
+    gray_padded[:, w + 1] = gray_padded[:, w]
+    if aux_energy is not None:
+        aux_energy = aux_energy.astype(np.float32)
+    parent = np.empty((h, w), dtype=np.int32)
+    dp = np.empty(w + 2, dtype=np.float32)
+    new_dp = np.empty(w + 2, dtype=np.float32)
+    cur_w = w
     for _ in range(num_seams):
-        seam = _get_forward_seam(gray, aux_energy)
-        seams[rows, idx_map[rows, seam]] = True
-        seam_mask = _get_seam_mask(gray, seam)
-        gray = _remove_seam_mask(gray, seam_mask)
-        idx_map = _remove_seam_mask(idx_map, seam_mask)
+        aux_view = None if aux_energy is None else aux_energy[:, :cur_w]
+        seam = _get_forward_seam(
+            gray_padded[:, : cur_w + 2],
+            aux_view,
+            parent[:, :cur_w],
+            dp[: cur_w + 2],
+            new_dp[: cur_w + 2],
+        )
+        _mark_seam_and_compact(orig_col, seam, cur_w, seams)
+        _compact_rows(gray_padded[:, 1:], seam, cur_w)
         if aux_energy is not None:
-            aux_energy = _remove_seam_mask(aux_energy, seam_mask)
+            _compact_rows(aux_energy, seam, cur_w)
+        cur_w -= 1
+        gray_padded[:, 0] = gray_padded[:, 1]
+        gray_padded[:, cur_w + 1] = gray_padded[:, cur_w]
 
     return seams
 
@@ -202,18 +511,29 @@ def _get_seams(
     energy_map: Optional[np.ndarray] = None,
     recompute_energy: bool = True,
 ) -> np.ndarray:
-    gray = np.asarray(gray, dtype=np.float32)
+    if (
+        energy_mode == EnergyMode.BACKWARD
+        and recompute_energy
+        and energy_map is None
+        and aux_energy is None
+        and gray.dtype == np.uint8
+    ):
+        # 8-bit sources without mask energy fit the integer DP
+        return _get_backward_seams_u8(gray, num_seams)
     if energy_map is not None:  # user-supplied
-        energy = energy_map.astype(np.float32).copy()
+        energy_map = energy_map.astype(np.float32)
         aux_energy = None  # already baked-in
         recompute_energy = False
-    else:
-        energy = _get_energy(gray)
-        if aux_energy is not None:
-            energy += aux_energy
     if energy_mode == EnergyMode.BACKWARD:
         if recompute_energy:
             return _get_backward_seams(gray, num_seams, aux_energy)
+        # The static path is the only consumer of a precomputed energy map
+        if energy_map is not None:
+            energy = energy_map
+        else:
+            energy = _get_energy(gray)
+            if aux_energy is not None:
+                energy += aux_energy
         return _get_backward_seams_static(energy, num_seams)
     if energy_mode == EnergyMode.FORWARD and recompute_energy:
         return _get_forward_seams(gray, num_seams, aux_energy)
@@ -226,14 +546,29 @@ def _reduce_width(
     energy_mode: str,
     aux_energy: Optional[np.ndarray],
     seam_dump: Optional[List[np.ndarray]] = None,
-    energy_map: Optional[np.ndarray] = None,
+    energy_map: Optional[List[np.ndarray]] = None,
     recompute_energy: bool = True,
+    neg_removed: Optional[List[np.ndarray]] = None,
 ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    # `energy_map` is a single-element list so the carved map propagates back
+    # to the caller across the width/height passes.
     assert src.ndim in (2, 3) and delta_width >= 0
     gray = src if src.ndim == 2 else _rgb2gray(src)
-    seams = _get_seams(gray, delta_width, energy_mode, aux_energy, energy_map=energy_map, recompute_energy=recompute_energy)
+    seams = _get_seams(gray, delta_width, energy_mode, aux_energy, energy_map=None if energy_map is None else energy_map[0], recompute_energy=recompute_energy)
     if seam_dump is not None:
         seam_dump.append(seams)
+    if neg_removed is not None and aux_energy is not None:
+        neg_removed.append(((aux_energy < 0) & seams).sum(axis=1).astype(np.int32))
+    if delta_width == 1:
+        # Single seam: the per-row copy kernel beats building a boolean keep
+        # mask and gathering every pixel through it.
+        seam = seams.argmax(axis=1).astype(np.int32)
+        dst = _remove_seam(src, seam)
+        if aux_energy is not None:
+            aux_energy = _remove_seam(aux_energy, seam)
+        if energy_map is not None:
+            energy_map[0] = _remove_seam(energy_map[0], seam)
+        return dst, aux_energy
     to_keep = ~seams
     if src.ndim == 2:
         h, w = src.shape
@@ -244,41 +579,58 @@ def _reduce_width(
     if aux_energy is not None:
         aux_energy = aux_energy[to_keep].reshape(dst.shape[:2])
     if energy_map is not None:
-        energy_map[:] = energy_map[to_keep].reshape(dst.shape[:2])
+        energy_map[0] = energy_map[0][to_keep].reshape(dst.shape[:2])
     return dst, aux_energy
 
 
 @nb.njit(
-    nb.float32[:, :, :](nb.float32[:, :, :], nb.boolean[:, :], nb.int32), cache=True
+    nb.float32[:, :, :](nb.float32[:, :, :], nb.boolean[:, :], nb.int32),
+    parallel=True,
+    cache=True,
 )
 def _insert_seams_kernel(
     src: np.ndarray, seams: np.ndarray, delta_width: int
 ) -> np.ndarray:
-    """The numba kernel for inserting seams"""
-    src_h, src_w, src_c = src.shape
-    dst = np.empty((src_h, src_w + delta_width, src_c), dtype=src.dtype)
-    for row in range(src_h):
-        dst_col = 0
-        for src_col in range(src_w):
-            if seams[row, src_col]:
-                left = src[row, max(src_col - 1, 0)]
-                right = src[row, src_col]
-                dst[row, dst_col] = (left + right) / 2
-                dst_col += 1
-            dst[row, dst_col] = src[row, src_col]
-            dst_col += 1
+    """The numba kernel for inserting seams, in planar (C, H, W) layout
+
+    Each row first collects its insertion columns, then copies the intervals
+    between them as straight slices, so the inner loops carry no per-pixel
+    branch on the seam mask.
+    """
+    src_c, src_h, src_w = src.shape
+    dst = np.empty((src_c, src_h, src_w + delta_width), dtype=src.dtype)
+    for row in nb.prange(src_h):
+        inserts = np.empty(delta_width, dtype=np.int32)
+        k = 0
+        for col in range(src_w):
+            if seams[row, col]:
+                inserts[k] = col
+                k += 1
+        for c in range(src_c):
+            prev = 0
+            for k in range(delta_width):
+                s = inserts[k]
+                dst[c, row, prev + k : s + k] = src[c, row, prev:s]
+                left = src[c, row, s - 1 if s > 0 else 0]
+                dst[c, row, s + k] = (left + src[c, row, s]) / 2
+                prev = s
+            dst[c, row, prev + delta_width :] = src[c, row, prev:]
     return dst
 
 
 def _insert_seams(src: np.ndarray, seams: np.ndarray, delta_width: int) -> np.ndarray:
     """Insert multiple seams into the source image"""
-    dst = src.astype(np.float32)
-    if dst.ndim == 2:
-        dst = dst[:, :, None]
-    dst = _insert_seams_kernel(dst, seams, delta_width).astype(src.dtype)
+    # Structure-of-arrays: each channel becomes a contiguous float32 plane so
+    # the kernel streams one plane at a time instead of strided interleaved
+    # pixels.
     if src.ndim == 2:
-        dst = dst.squeeze(-1)
-    return dst
+        planar = src.astype(np.float32)[None]
+    else:
+        planar = src.transpose(2, 0, 1).astype(np.float32)
+    dst = _insert_seams_kernel(planar, seams, delta_width)
+    if src.ndim == 2:
+        return dst[0].astype(src.dtype)
+    return dst.transpose(1, 2, 0).astype(src.dtype)
 
 
 def _expand_width(
@@ -288,23 +640,35 @@ def _expand_width(
     aux_energy: Optional[np.ndarray],
     step_ratio: float,
     seam_dump: Optional[List[np.ndarray]] = None,
-    energy_map: Optional[np.ndarray] = None,
+    energy_map: Optional[List[np.ndarray]] = None,
     recompute_energy: bool = True,
 ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
     assert 0 < step_ratio <= 1
     dst = src
+    gray = dst if dst.ndim == 2 else _rgb2gray(dst)
     while delta_width:
         max_step = max(1, round(step_ratio * dst.shape[1]))
         step = min(max_step, delta_width)
-        gray = dst if dst.ndim == 2 else _rgb2gray(dst)
-        seams = _get_seams(gray, step, energy_mode, aux_energy, energy_map=energy_map, recompute_energy=recompute_energy)
+        seams = _get_seams(gray, step, energy_mode, aux_energy, energy_map=None if energy_map is None else energy_map[0], recompute_energy=recompute_energy)
         if seam_dump is not None:
             seam_dump.append(seams)
         dst = _insert_seams(dst, seams, step)
+        if dst.ndim == 2:
+            gray = dst
+        else:
+            # Seam insertion only shifts existing pixels, so the grayscale
+            # image stays valid everywhere except at the inserted columns,
+            # which are patched from the freshly averaged RGB pixels.
+            gray = _insert_seams(gray, seams, step)
+            h = gray.shape[0]
+            _, insert_cols = np.nonzero(seams)
+            insert_cols = insert_cols.reshape(h, step) + np.arange(step)
+            rows = np.arange(h)[:, None]
+            gray[rows, insert_cols] = _rgb2gray(dst[rows, insert_cols])
         if aux_energy is not None:
             aux_energy = _insert_seams(aux_energy, seams, step)
         if energy_map is not None:
-            energy_map = _insert_seams(energy_map, seams, step)
+            energy_map[0] = _insert_seams(energy_map[0], seams, step)
         delta_width -= step
     return dst, aux_energy
 
@@ -346,13 +710,13 @@ def _resize_height(
     aux_energy: Optional[np.ndarray],
     step_ratio: float,
     seam_dump: Optional[List[np.ndarray]] = None,
-    energy_map: Optional[np.ndarray] = None,
+    energy_map: Optional[List[np.ndarray]] = None,
     recompute_energy: bool = True,
 ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
     if aux_energy is not None:
         aux_energy = aux_energy.T
     if energy_map is not None:
-        energy_map = energy_map.T
+        energy_map[0] = energy_map[0].T
     src = _transpose_image(src)
     if src.shape[1] > height:
         src, aux_energy = _reduce_width(src, abs(src.shape[1] - height), energy_mode, aux_energy, seam_dump, energy_map, recompute_energy)
@@ -362,7 +726,7 @@ def _resize_height(
     if aux_energy is not None:
         aux_energy = aux_energy.T
     if energy_map is not None:
-        energy_map = energy_map.T
+        energy_map[0] = energy_map[0].T
     return src, aux_energy
 
 
@@ -444,10 +808,17 @@ def resize(
             src = _transpose_image(src)
             aux_energy = aux_energy.T
 
-        num_seams = (aux_energy < 0).sum(1).max()
+        # Track the per-row count of drop-mask pixels incrementally instead
+        # of re-scanning aux_energy after every batch of seams.
+        row_neg = (aux_energy < 0).sum(axis=1).astype(np.int32)
+        num_seams = row_neg.max()
         while num_seams > 0:
-            src, aux_energy = _reduce_width(src, num_seams, energy_mode, aux_energy)
-            num_seams = (aux_energy < 0).sum(1).max()
+            removed: List[np.ndarray] = []
+            src, aux_energy = _reduce_width(
+                src, num_seams, energy_mode, aux_energy, neg_removed=removed
+            )
+            row_neg -= removed[0]
+            num_seams = row_neg.max()
 
         if order == OrderMode.HEIGHT_FIRST:
             src = _transpose_image(src)
@@ -505,34 +876,158 @@ def remove_object(
 
     gray = src if src.ndim == 2 else _rgb2gray(src)
 
+    h, w = gray.shape
+    parent = np.empty((h, w), dtype=np.int32)
+    cost = np.empty(w + 2, dtype=np.float32)
+    new_cost = np.empty(w + 2, dtype=np.float32)
     while drop_mask.any():
         energy = _get_energy(gray)
         energy[drop_mask] -= DROP_MASK_ENERGY
         if keep_mask is not None:
             energy[keep_mask] += KEEP_MASK_ENERGY
-        seam = _get_backward_seam(energy)
-        seam_mask = _get_seam_mask(src, seam)
-        gray = _remove_seam_mask(gray, seam_mask)
-        drop_mask = _remove_seam_mask(drop_mask, seam_mask)
-        src = _remove_seam_mask(src, seam_mask)
+        cur_w = energy.shape[1]
+        seam = _get_backward_seam(
+            energy, parent[:, :cur_w], cost[: cur_w + 2], new_cost[: cur_w + 2]
+        )
+        gray = _remove_seam(gray, seam)
+        drop_mask = _remove_seam(drop_mask, seam)
+        src = _remove_seam(src, seam)
         if keep_mask is not None:
-            keep_mask = _remove_seam_mask(keep_mask, seam_mask)
+            keep_mask = _remove_seam(keep_mask, seam)
 
     return src
 
 
+# How many disjoint seams to extract from one DP pass on the static path.
+_KBEST_BATCH = 16
+
+
+@nb.njit(
+    nb.int32[:, :](
+        nb.float32[:, :], nb.int32[:, :], nb.float32[:], nb.float32[:], nb.int64
+    ),
+    parallel=True,
+    nogil=True,
+    fastmath=True,
+    boundscheck=False,
+    cache=True,
+)
+def _get_backward_seams_kbest(
+    energy: np.ndarray,
+    parent: np.ndarray,
+    cost: np.ndarray,
+    new_cost: np.ndarray,
+    k: int,
+) -> np.ndarray:
+    """Extract up to ``k`` pairwise-disjoint low-cost seams from one DP pass
+
+    The forward pass matches ``_get_backward_seam``; the end columns are then
+    visited in order of total cost and a seam is kept whenever its path does
+    not touch a previously accepted one. Rows are sequential (the recurrence),
+    but within a row every column depends only on the previous cost row, so
+    the column loop runs in parallel with bit-identical results.
+    """
+    h, w = energy.shape
+    cost[0] = _DP_SENTINEL
+    cost[w + 1] = _DP_SENTINEL
+    new_cost[0] = _DP_SENTINEL
+    new_cost[w + 1] = _DP_SENTINEL
+    for j in range(w):
+        cost[j + 1] = energy[0, j]
+
+    for r in range(1, h):
+        for j in nb.prange(w):
+            left = cost[j]
+            mid = cost[j + 1]
+            right = cost[j + 2]
+            if left <= mid and left <= right:
+                p = j - 1
+                m = left
+            elif mid <= right:
+                p = j
+                m = mid
+            else:
+                p = j + 1
+                m = right
+            parent[r, j] = p
+            new_cost[j + 1] = m + energy[r, j]
+        cost, new_cost = new_cost, cost
+
+    order = np.argsort(cost[1 : w + 1])
+    out = np.empty((k, h), dtype=np.int32)
+    used = np.zeros((h, w), dtype=np.bool_)
+    tmp = np.empty(h, dtype=np.int32)
+    count = 0
+    for i in range(w):
+        if count >= k:
+            break
+        c = order[i]
+        ok = True
+        for r in range(h - 1, -1, -1):
+            if used[r, c]:
+                ok = False
+                break
+            tmp[r] = c
+            c = parent[r, c]
+        if not ok:
+            continue
+        for r in range(h):
+            used[r, tmp[r]] = True
+            out[count, r] = tmp[r]
+        count += 1
+    return out[:count]
+
+
+@nb.njit(
+    [
+        nb.void(nb.float32[:, :], nb.int32[:, :], nb.int64),
+        nb.void(nb.int32[:, :], nb.int32[:, :], nb.int64),
+    ],
+    parallel=True,
+    cache=True,
+)
+def _compact_rows_multi(buf: np.ndarray, cols: np.ndarray, cur_w: int) -> None:
+    """Drop several columns per row in-place; ``cols`` rows must be sorted"""
+    h, k = cols.shape
+    for r in nb.prange(h):
+        dst = cols[r, 0]
+        for i in range(k):
+            src_end = cols[r, i + 1] if i + 1 < k else cur_w
+            for j in range(cols[r, i] + 1, src_end):
+                buf[r, dst] = buf[r, j]
+                dst += 1
+
+
 def _get_backward_seams_static(energy: np.ndarray, num_seams: int) -> np.ndarray:
     """Remove *num_seams* using the *initial* energy only (fast)."""
     h, w = energy.shape
     seams = np.zeros((h, w), dtype=bool)
     rows = np.arange(h, dtype=np.int32)
-    idx_map = np.broadcast_to(np.arange(w, dtype=np.int32), (h, w))
-    for _ in range(num_seams):
-        seam = _get_backward_seam(energy)
-        seams[rows, idx_map[rows, seam]] = True
-        seam_mask = _get_seam_mask(energy, seam)
-        energy = _remove_seam_mask(energy, seam_mask)
-        idx_map = _remove_seam_mask(idx_map, seam_mask)
+    orig_col = np.empty((h, w), dtype=np.int32)
+    orig_col[:] = np.arange(w, dtype=np.int32)
+    # _get_seams hands over an owned float32 map, so this is normally a no-op
+    energy = np.ascontiguousarray(energy, dtype=np.float32)
+    parent = np.empty((h, w), dtype=np.int32)
+    cost = np.empty(w + 2, dtype=np.float32)
+    new_cost = np.empty(w + 2, dtype=np.float32)
+    cur_w = w
+    remaining = num_seams
+    while remaining > 0:
+        k = min(remaining, _KBEST_BATCH)
+        batch = _get_backward_seams_kbest(
+            energy[:, :cur_w],
+            parent[:, :cur_w],
+            cost[: cur_w + 2],
+            new_cost[: cur_w + 2],
+            k,
+        )
+        for seam in batch:
+            seams[rows, orig_col[rows, seam]] = True
+        cols = np.sort(batch.T, axis=1)
+        _compact_rows_multi(energy, cols, cur_w)
+        _compact_rows_multi(orig_col, cols, cur_w)
+        cur_w -= len(batch)
+        remaining -= len(batch)
     return seams
 
 
@@ -540,8 +1035,8 @@ def _prune_low_energy(src: np.ndarray, energy: np.ndarray, thr: float) -> Tuple[
     """Remove *entire* rows / columns whose **mean** energy < thr."""
     keep_rows = energy.mean(1) >= thr
     keep_cols = energy.mean(0) >= thr
-    src = src[np.ix_(keep_rows, keep_cols, *([slice(None)] if src.ndim == 3 else []))]
-    energy = energy[np.ix_(keep_rows, keep_cols)]
+    src = src[keep_rows][:, keep_cols]
+    energy = energy[keep_rows][:, keep_cols]
     return src, energy
 
 
@@ -569,10 +1064,17 @@ def _erase_object(
     if order == OrderMode.HEIGHT_FIRST:
         src = _transpose_image(src)
         aux_energy = aux_energy.T
-    num_seams = (aux_energy < 0).sum(1).max()
+    # Track the per-row count of drop-mask pixels incrementally instead of
+    # re-scanning aux_energy after every batch of seams.
+    row_neg = (aux_energy < 0).sum(axis=1).astype(np.int32)
+    num_seams = row_neg.max()
     while num_seams:
-        src, aux_energy = _reduce_width(src, num_seams, energy_mode, aux_energy)
-        num_seams = (aux_energy < 0).sum(1).max()
+        removed: List[np.ndarray] = []
+        src, aux_energy = _reduce_width(
+            src, num_seams, energy_mode, aux_energy, neg_removed=removed
+        )
+        row_neg -= removed[0]
+        num_seams = row_neg.max()
     if order == OrderMode.HEIGHT_FIRST:
         src = _transpose_image(src)
         aux_energy = aux_energy.T
@@ -631,8 +1133,10 @@ def resize_advanced(
         aux_energy[drop_mask] -= DROP_MASK_ENERGY
         src, aux_energy = _erase_object(src, drop_mask, energy_mode, order, aux_energy)
     seam_vis: List[np.ndarray] = []
+    # The internal helpers carry the energy map in a single-element list so
+    # the carved map survives across the width and height passes.
+    energy_holder = None if energy_map is None else [np.asarray(energy_map)]
     def _carve_along_width(img, target_w, aux):
-        nonlocal energy_map
         delta = abs(img.shape[1] - target_w)
         if delta == 0:
             return img, aux
@@ -640,22 +1144,21 @@ def resize_advanced(
             return _expand_width(
                 img, delta, energy_mode, aux, step_ratio,
                 seam_vis if visualize else None,
-                energy_map, recompute_energy,
+                energy_holder, recompute_energy,
             )
         return _reduce_width(
             img, delta, energy_mode, aux,
             seam_vis if visualize else None,
-            energy_map, recompute_energy,
+            energy_holder, recompute_energy,
         )
     def _carve_along_height(img, target_h, aux):
-        nonlocal energy_map
         delta = abs(img.shape[0] - target_h)
         if delta == 0:
             return img, aux
         return _resize_height(
             img, target_h, energy_mode, aux, step_ratio,
             seam_vis if visualize else None,
-            energy_map, recompute_energy,
+            energy_holder, recompute_energy,
         )
     if size is not None:
         width, height = map(int, size)